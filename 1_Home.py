@@ -5,6 +5,8 @@ import magic
 import pandas as pd
 from docx import Document
 from streamlit_echarts import st_echarts
+from folder_watch import FolderWatcher
+from scan_filters import ScanFilter, scan_filter_inputs
 
 
 def get_file_info(file_path):
@@ -64,14 +66,15 @@ def get_file_info(file_path):
             "title": ""
         }
 
-def analyze_folder(folder_path):
+def analyze_folder(folder_path, scan_filter=None):
     total_size = 0
     file_count = 0
     dir_count = 0
     file_types = {}
     items_info = []
+    scan_filter = scan_filter or ScanFilter()
 
-    for root, dirs, files in os.walk(folder_path):
+    for root, dirs, files in scan_filter.walk(folder_path):
         for name in dirs:
             dir_path = os.path.join(root, name)
             dir_info = get_file_info(dir_path)
@@ -101,6 +104,55 @@ def analyze_folder(folder_path):
         'items_info': items_info
     }
 
+def show_results(results):
+    st.header("📜 Summary")
+    col1, col2, col3, col4 = st.columns(4)
+    col1.metric("Total Items", results['file_count'] + results['dir_count'])
+    col2.metric("Files", results['file_count'])
+    col3.metric("Directories", results['dir_count'])
+    col4.metric("Total Size", f"{results['total_size'] / (1024*1024):.2f} MB")
+
+    st.header("📁 Folder Contents")
+    if not results['items_info']:
+        st.info("No files or folders match the current rules.")
+    else:
+        df = pd.DataFrame(results['items_info'])
+        df['size'] = df['size'].apply(lambda x: f"{x / 1024:.2f} KB")
+        df['date_modified'] = df['date_modified'].dt.strftime('%Y-%m-%d %H:%M:%S')
+        df['date_created'] = df['date_created'].dt.strftime('%Y-%m-%d %H:%M:%S')
+        st.dataframe(df, use_container_width=True)
+
+    st.header("📚 File Types")
+    file_types_data = [{"name": ext or "No extension", "value": count} for ext, count in results['file_types'].items()]
+    options = {
+        "tooltip": {"trigger": "item"},
+        "legend": {"top": "5%", "left": "center"},
+        "series": [{
+            "name": "File Types",
+            "type": "pie",
+            "radius": ["40%", "70%"],
+            "avoidLabelOverlap": False,
+            "itemStyle": {
+                "borderRadius": 10,
+                "borderColor": "#fff",
+                "borderWidth": 2
+            },
+            "label": {"show": False, "position": "center"},
+            "emphasis": {
+                "label": {"show": True, "fontSize": "40", "fontWeight": "bold"}
+            },
+            "labelLine": {"show": False},
+            "data": file_types_data
+        }]
+    }
+    st_echarts(options=options, height="400px")
+
+@st.fragment(run_every=2)
+def rerun_on_change(watcher, version):
+    # Cheap poll; the results are only rebuilt when a flush changed something.
+    if watcher.version != version:
+        st.rerun()
+
 def main():
     st.set_page_config(page_title="Folder Analysis App", page_icon="🗂️", layout="wide")
     # Hide the Streamlit menu
@@ -116,56 +168,48 @@ def main():
     st.title("🗂️ Folder Analysis Application")
 
     folder_path = st.text_input("Enter the folder path to analyze:")
-    
+    scan_filter = scan_filter_inputs()
+    watch_mode = st.checkbox("Watch for changes", help="Keep the results current as files are added, changed or removed, without rescanning.")
+    watcher = st.session_state.get("watcher")
+
     if st.button("Analyze"):
         if not folder_path:
             st.error("Please enter a folder path.")
         elif not os.path.exists(folder_path):
             st.error(f"The folder '{folder_path}' does not exist.")
         else:
-            with st.spinner("Analyzing folder..."):
-                results = analyze_folder(folder_path)
-
-            st.success("Analysis complete!")
-
-            st.header("📜 Summary")
-            col1, col2, col3, col4 = st.columns(4)
-            col1.metric("Total Items", results['file_count'] + results['dir_count'])
-            col2.metric("Files", results['file_count'])
-            col3.metric("Directories", results['dir_count'])
-            col4.metric("Total Size", f"{results['total_size'] / (1024*1024):.2f} MB")
-
-            st.header("📁 Folder Contents")
-            df = pd.DataFrame(results['items_info'])
-            df['size'] = df['size'].apply(lambda x: f"{x / 1024:.2f} KB")
-            df['date_modified'] = df['date_modified'].dt.strftime('%Y-%m-%d %H:%M:%S')
-            df['date_created'] = df['date_created'].dt.strftime('%Y-%m-%d %H:%M:%S')
-            st.dataframe(df, use_container_width=True)
-
-            st.header("📚 File Types")
-            file_types_data = [{"name": ext or "No extension", "value": count} for ext, count in results['file_types'].items()]
-            options = {
-                "tooltip": {"trigger": "item"},
-                "legend": {"top": "5%", "left": "center"},
-                "series": [{
-                    "name": "File Types",
-                    "type": "pie",
-                    "radius": ["40%", "70%"],
-                    "avoidLabelOverlap": False,
-                    "itemStyle": {
-                        "borderRadius": 10,
-                        "borderColor": "#fff",
-                        "borderWidth": 2
-                    },
-                    "label": {"show": False, "position": "center"},
-                    "emphasis": {
-                        "label": {"show": True, "fontSize": "40", "fontWeight": "bold"}
-                    },
-                    "labelLine": {"show": False},
-                    "data": file_types_data
-                }]
-            }
-            st_echarts(options=options, height="400px")
+            if watcher is not None:
+                watcher.stop()
+                st.session_state.watcher = watcher = None
+
+            if watch_mode:
+                watcher = FolderWatcher(folder_path, get_file_info, scan_filter=scan_filter)
+                with st.spinner("Analyzing folder..."):
+                    watcher.start()
+                st.session_state.watcher = watcher
+            else:
+                with st.spinner("Analyzing folder..."):
+                    results = analyze_folder(folder_path, scan_filter)
+
+                st.success("Analysis complete!")
+                show_results(results)
+
+    if watcher is not None:
+        # A different folder needs its own Analyze run, so stop watching the old one.
+        if not watch_mode or watcher.folder_path != os.path.abspath(folder_path):
+            watcher.stop()
+            st.session_state.watcher = None
+        else:
+            if watcher.scan_filter.rules != scan_filter.rules:
+                watcher.stop()
+                watcher = FolderWatcher(watcher.folder_path, get_file_info, scan_filter=scan_filter)
+                with st.spinner("Analyzing folder..."):
+                    watcher.start()
+                st.session_state.watcher = watcher
+            st.success(f"👀 Watching '{watcher.folder_path}' for changes.")
+            results = watcher.snapshot()
+            show_results(results)
+            rerun_on_change(watcher, results['version'])
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -1,18 +1,25 @@
 import os
 import datetime
+import argparse
+from scan_filters import DEFAULT_EXCLUDES, ScanFilter
 
-def analyze_folder(folder_path, indent=""):
+def analyze_folder(folder_path, indent="", scan_filter=None, rel_path=""):
     total_size = 0
     file_count = 0
     dir_count = 0
     file_types = {}
     newest_item = None
     oldest_item = None
+    scan_filter = scan_filter or ScanFilter()
+    depth = rel_path.count(os.sep) + 1 if rel_path else 0
 
     for item in os.listdir(folder_path):
         item_path = os.path.join(folder_path, item)
+        item_rel_path = os.path.join(rel_path, item)
         
         if os.path.isfile(item_path):
+            if not scan_filter.allows_file(item_rel_path, item_path):
+                continue
             file_count += 1
             size = os.path.getsize(item_path)
             total_size += size
@@ -23,16 +30,20 @@ def analyze_folder(folder_path, indent=""):
             print(f"{indent}{item} ({size / 1024:.2f} KB)")
         
         elif os.path.isdir(item_path):
+            # Excluded folders are skipped before recursing, so their contents are never listed.
+            if not scan_filter.allows_dir(item_rel_path):
+                continue
             dir_count += 1
             print(f"{indent}{item}/ (Directory)")
-            sub_stats = analyze_folder(item_path, indent + "  ")
-            
-            total_size += sub_stats['total_size']
-            file_count += sub_stats['file_count']
-            dir_count += sub_stats['dir_count']
-            
-            for ext, count in sub_stats['file_types'].items():
-                file_types[ext] = file_types.get(ext, 0) + count
+            if scan_filter.max_depth is None or depth < scan_filter.max_depth:
+                sub_stats = analyze_folder(item_path, indent + "  ", scan_filter, item_rel_path)
+                
+                total_size += sub_stats['total_size']
+                file_count += sub_stats['file_count']
+                dir_count += sub_stats['dir_count']
+                
+                for ext, count in sub_stats['file_types'].items():
+                    file_types[ext] = file_types.get(ext, 0) + count
         
         mod_time = os.path.getmtime(item_path)
         if newest_item is None or mod_time > os.path.getmtime(os.path.join(folder_path, newest_item)):
@@ -49,8 +60,9 @@ def analyze_folder(folder_path, indent=""):
         print("\nFile types:")
         for ext, count in file_types.items():
             print(f"  {ext or 'No extension'}: {count}")
-        print(f"\nNewest item: {newest_item} (modified {datetime.datetime.fromtimestamp(os.path.getmtime(os.path.join(folder_path, newest_item)))})")
-        print(f"Oldest item: {oldest_item} (modified {datetime.datetime.fromtimestamp(os.path.getmtime(os.path.join(folder_path, oldest_item)))})")
+        if newest_item is not None:  # Everything may have been filtered out
+            print(f"\nNewest item: {newest_item} (modified {datetime.datetime.fromtimestamp(os.path.getmtime(os.path.join(folder_path, newest_item)))})")
+            print(f"Oldest item: {oldest_item} (modified {datetime.datetime.fromtimestamp(os.path.getmtime(os.path.join(folder_path, oldest_item)))})")
 
     return {
         'total_size': total_size,
@@ -61,6 +73,29 @@ def analyze_folder(folder_path, indent=""):
         'oldest_item': oldest_item
     }
 
-# Example usage
-folder_to_analyze = r"C:\Users\ashwin.gawli\OneDrive - TBH\Documents\Projects\ClaimsNDisputes\ClaimsndisputesGpt\Test Dataset - Dora Creek"  # Use 'r' prefix for raw string
-analyze_folder(folder_to_analyze)
\ No newline at end of file
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Print a folder tree and summary.")
+    parser.add_argument("folder", nargs="?",
+                        default=r"C:\Users\ashwin.gawli\OneDrive - TBH\Documents\Projects\ClaimsNDisputes\ClaimsndisputesGpt\Test Dataset - Dora Creek")
+    parser.add_argument("--include", action="append", default=[], help="Gitignore-style pattern of files to include (repeatable).")
+    parser.add_argument("--exclude", action="append", default=None, help="Gitignore-style pattern to exclude (repeatable). Defaults to common VCS, dependency, backup and temp folders.")
+    parser.add_argument("--max-depth", type=int, help="How many folder levels below the folder to descend.")
+    parser.add_argument("--min-size", type=int, help="Skip files smaller than this many bytes.")
+    parser.add_argument("--max-size", type=int, help="Skip files larger than this many bytes.")
+    parser.add_argument("--min-age-days", type=float, help="Skip files modified more recently than this.")
+    parser.add_argument("--max-age-days", type=float, help="Skip files modified longer ago than this.")
+    args = parser.parse_args()
+
+    try:
+        scan_filter = ScanFilter(
+            include=args.include,
+            exclude=DEFAULT_EXCLUDES if args.exclude is None else args.exclude,
+            max_depth=args.max_depth,
+            min_size=args.min_size,
+            max_size=args.max_size,
+            min_age_days=args.min_age_days,
+            max_age_days=args.max_age_days,
+        )
+    except ValueError as e:
+        parser.error(str(e))
+    analyze_folder(args.folder, scan_filter=scan_filter)
\ No newline at end of file
@@ -0,0 +1,2 @@
+# Lets a plain `pytest` run import the top-level modules (pytest puts this
+# file's directory on sys.path).
@@ -2,8 +2,9 @@ import streamlit as st
 import os
 import datetime
 from streamlit_echarts import st_echarts
+from scan_filters import ScanFilter, scan_filter_inputs
 
-def analyze_folder(folder_path):
+def analyze_folder(folder_path, scan_filter=None):
     total_size = 0
     file_count = 0
     dir_count = 0
@@ -11,8 +12,9 @@ def analyze_folder(folder_path):
     newest_item = None
     oldest_item = None
     tree_structure = []
+    scan_filter = scan_filter or ScanFilter()
 
-    for root, dirs, files in os.walk(folder_path):
+    for root, dirs, files in scan_filter.walk(folder_path):
         level = root.replace(folder_path, '').count(os.sep)
         indent = '&nbsp;' * 4 * level
         folder_name = os.path.basename(root)
@@ -51,6 +53,7 @@ def main():
     st.title("📊 Folder Analysis App")
 
     folder_path = st.text_input("Enter the folder path to analyze:")
+    scan_filter = scan_filter_inputs()
     
     if st.button("Analyze"):
         if not folder_path:
@@ -59,7 +62,7 @@ def main():
             st.error(f"The folder '{folder_path}' does not exist.")
         else:
             with st.spinner("Analyzing folder..."):
-                results = analyze_folder(folder_path)
+                results = analyze_folder(folder_path, scan_filter)
 
             st.success("Analysis complete!")
 
@@ -0,0 +1,283 @@
+import os
+import datetime
+import threading
+import time
+from watchdog.observers import Observer
+from watchdog.events import FileSystemEventHandler
+from scan_filters import ScanFilter
+
+SUMMARY_EXTENSIONS = ('.pdf', '.docx', '.xlsx', '.xls')
+WATCHED_EVENTS = ('created', 'modified', 'deleted', 'moved')
+
+
+def basic_file_info(file_path):
+    stat = os.stat(file_path)
+    return {
+        "name": os.path.basename(file_path),
+        "type": "File",
+        "size": stat.st_size,
+        "date_modified": datetime.datetime.fromtimestamp(stat.st_mtime)
+    }
+
+
+class _ChangeHandler(FileSystemEventHandler):
+    def __init__(self, watcher):
+        super().__init__()
+        self.watcher = watcher
+
+    def on_any_event(self, event):
+        if event.event_type not in WATCHED_EVENTS:
+            return
+        self.watcher.mark_changed(event.src_path)
+        if event.event_type == 'moved':
+            self.watcher.mark_changed(event.dest_path)
+
+
+class FolderWatcher:
+    """Keeps folder analysis results current from filesystem events.
+
+    One full scan is done on start(); after that create, modify, delete and
+    move events are collected per path and applied as incremental updates
+    once the folder has been quiet for `debounce` seconds, so a burst of
+    events on the same file costs a single stat. A folder that never goes
+    quiet is still flushed every `max_latency` seconds.
+
+    Events under folders excluded by `scan_filter` are dropped before they
+    are queued. The OS watch itself is still recursive, so the observer
+    keeps watches on excluded folders such as .git or node_modules.
+
+    Streamlit has no hook for a session ending, so a watcher kept in
+    st.session_state runs until the page stops it or the server exits
+    (its threads are daemons).
+    """
+
+    def __init__(self, folder_path, file_info=basic_file_info, debounce=0.5, summary_queue=None,
+                 scan_filter=None, max_latency=5.0):
+        self.folder_path = os.path.abspath(folder_path)
+        self.file_info = file_info
+        self.debounce = debounce
+        self.max_latency = max_latency
+        self.summary_queue = summary_queue
+        self.scan_filter = scan_filter or ScanFilter()
+
+        self.items = {}
+        self.total_size = 0
+        self.file_count = 0
+        self.dir_count = 0
+        self.file_types = {}
+        self._children = {}
+        # Bumped on every scan and every flush that applied events, so
+        # readers can tell cheaply whether anything changed.
+        self.version = 0
+
+        self._lock = threading.Lock()
+        self._pending = set()
+        self._changed = threading.Event()
+        self._stopped = threading.Event()
+        self._observer = None
+        self._worker = None
+
+    def start(self):
+        # Watch before scanning so changes made during a long first scan are
+        # kept in _pending and applied by the worker once the scan is done.
+        self._stopped.clear()
+        self._observer = Observer()
+        self._observer.schedule(_ChangeHandler(self), self.folder_path, recursive=True)
+        self._observer.start()
+        self.scan()
+        self._worker = threading.Thread(target=self._run, daemon=True)
+        self._worker.start()
+
+    def stop(self):
+        self._stopped.set()
+        self._changed.set()
+        if self._observer is not None:
+            self._observer.stop()
+            self._observer.join()
+            self._observer = None
+        if self._worker is not None:
+            self._worker.join()
+            self._worker = None
+
+    @property
+    def is_running(self):
+        return self._worker is not None and self._worker.is_alive()
+
+    def scan(self):
+        with self._lock:
+            self.items = {}
+            self.total_size = 0
+            self.file_count = 0
+            self.dir_count = 0
+            self.file_types = {}
+            self._children = {}
+            self._add_tree(self.folder_path)
+            self.version += 1
+
+    def mark_changed(self, path):
+        path = os.path.abspath(path)
+        if not path.startswith(self.folder_path + os.sep):
+            return
+        if not self.scan_filter.allows_parents(self.folder_path, path):
+            return
+        rel_path = os.path.relpath(path, self.folder_path)
+        with self._lock:
+            # An excluded folder itself (e.g. .git being modified) is never tracked.
+            if (path not in self.items and not self.scan_filter.allows_dir(rel_path)
+                    and os.path.isdir(path)):
+                return
+            self._pending.add(path)
+        self._changed.set()
+
+    def flush(self):
+        with self._lock:
+            pending, self._pending = self._pending, set()
+            if pending:
+                self.version += 1
+            changed_files = []
+            walked = set()
+            # Parents sort before children, so a new folder is walked once
+            # and events for paths inside it are already covered.
+            for path in sorted(pending):
+                if path == self.folder_path or not path.startswith(self.folder_path + os.sep):
+                    continue
+                if self._under(path, walked):
+                    continue
+                if (not os.path.lexists(path)
+                        or not self.scan_filter.allows_path(self.folder_path, path, os.path.isdir(path))):
+                    self._remove_tree(path)
+                elif os.path.isdir(path) and path not in self.items:
+                    changed_files.extend(self._add_tree(path))
+                    walked.add(path)
+                else:
+                    self._add_item(path)
+                    if path in self.items and self.items[path]["type"] != "Folder":
+                        changed_files.append(path)
+
+        if self.summary_queue is not None:
+            for path in changed_files:
+                if path.lower().endswith(SUMMARY_EXTENSIONS):
+                    self.summary_queue.put(path)
+        return len(pending)
+
+    def file_paths(self):
+        with self._lock:
+            return sorted(path for path, info in self.items.items() if info["type"] != "Folder")
+
+    def snapshot(self):
+        with self._lock:
+            return {
+                'total_size': self.total_size,
+                'file_count': self.file_count,
+                'dir_count': self.dir_count,
+                'file_types': dict(self.file_types),
+                'items_info': [dict(info) for info in self.items.values()],
+                'version': self.version
+            }
+
+    def tree_structure(self):
+        with self._lock:
+            return self._tree_structure()
+
+    def _run(self):
+        while not self._stopped.is_set():
+            self._changed.wait()
+            # Wait for a quiet period so bursts are coalesced into one flush,
+            # but never longer than max_latency after the first event.
+            deadline = time.monotonic() + self.max_latency
+            while True:
+                self._changed.clear()
+                timeout = min(self.debounce, deadline - time.monotonic())
+                if timeout <= 0:
+                    break
+                if self._stopped.wait(timeout):
+                    return
+                if not self._changed.is_set():
+                    break
+            self.flush()
+
+    def _under(self, path, folders):
+        parent = os.path.dirname(path)
+        while parent != self.folder_path and len(parent) > len(self.folder_path):
+            if parent in folders:
+                return True
+            parent = os.path.dirname(parent)
+        return False
+
+    def _item_info(self, path):
+        info = self.file_info(path)
+        if os.path.isdir(path):
+            info["type"] = "Folder"
+            try:
+                info["num_files"] = len(os.listdir(path))
+            except:
+                info["num_files"] = "Access Denied"
+        return info
+
+    def _add_tree(self, folder_path):
+        added_files = []
+        if folder_path != self.folder_path:
+            self._add_item(folder_path)
+        for root, dirs, files in self.scan_filter.walk(self.folder_path, start=folder_path):
+            for name in dirs:
+                self._add_item(os.path.join(root, name))
+            for name in files:
+                file_path = os.path.join(root, name)
+                if self._add_item(file_path):
+                    added_files.append(file_path)
+        return added_files
+
+    def _add_item(self, path):
+        self._discard(path)
+        try:
+            info = self._item_info(path)
+        except OSError:
+            return None  # Gone again before we got to it; the delete event will follow.
+        self.items[path] = info
+        self._children.setdefault(os.path.dirname(path), set()).add(path)
+        if info["type"] == "Folder":
+            self.dir_count += 1
+        else:
+            self.file_count += 1
+            self.total_size += info["size"]
+            _, ext = os.path.splitext(path)
+            self.file_types[ext] = self.file_types.get(ext, 0) + 1
+        return info
+
+    def _discard(self, path):
+        info = self.items.pop(path, None)
+        if info is None:
+            return
+        siblings = self._children.get(os.path.dirname(path))
+        if siblings is not None:
+            siblings.discard(path)
+        if info["type"] == "Folder":
+            self.dir_count -= 1
+        else:
+            self.file_count -= 1
+            self.total_size -= info["size"]
+            _, ext = os.path.splitext(path)
+            self.file_types[ext] -= 1
+            if self.file_types[ext] == 0:
+                del self.file_types[ext]
+
+    def _remove_tree(self, path):
+        # Only tracked folders have children, so a file or an untracked path
+        # costs a dict lookup rather than a scan of every item.
+        stack = [path]
+        while stack:
+            item_path = stack.pop()
+            stack.extend(self._children.pop(item_path, ()))
+            self._discard(item_path)
+
+    def _tree_structure(self):
+        tree_structure = [f"📁 **{os.path.basename(self.folder_path)}/**"]
+        for path in sorted(self.items, key=lambda p: os.path.relpath(p, self.folder_path).split(os.sep)):
+            info = self.items[path]
+            level = os.path.relpath(path, self.folder_path).count(os.sep) + 1
+            indent = '&nbsp;' * 4 * level
+            if info["type"] == "Folder":
+                tree_structure.append(f"{indent}📁 **{info['name']}/**")
+            else:
+                tree_structure.append(f"{indent}📄 {info['name']} ({info['size'] / 1024:.2f} KB)")
+        return tree_structure
@@ -6,6 +6,9 @@ from dotenv import load_dotenv
 import pandas as pd
 import docx
 import openpyxl
+import queue
+from folder_watch import SUMMARY_EXTENSIONS, FolderWatcher
+from scan_filters import ScanFilter, scan_filter_inputs
 
 # Specify the path to your .env file
 env_path = os.path.join(os.path.dirname(__file__), '..', 'config', '.env')
@@ -67,50 +70,135 @@ def summarize_text(text, max_tokens=150):
     )
     return response.choices[0].message.content.strip()
 
-def get_supported_files(folder_path):
+def get_supported_files(folder_path, scan_filter=None):
     supported_files = []
-    for root, dirs, files in os.walk(folder_path):
+    scan_filter = scan_filter or ScanFilter()
+    for root, dirs, files in scan_filter.walk(folder_path):
         for file in files:
             if file.lower().endswith(('.pdf', '.docx', '.xlsx', '.xls')):
                 supported_files.append(os.path.join(root, file))
     return supported_files
 
+def summarize_file(file_path, folder_path):
+    if file_path.lower().endswith('.pdf'):
+        text = get_pdf_text(file_path)
+    elif file_path.lower().endswith('.docx'):
+        text = get_docx_text(file_path)
+    elif file_path.lower().endswith(('.xlsx', '.xls')):
+        text = get_excel_text(file_path)
+    else:
+        return None
+
+    summary = summarize_text(text)
+    relative_path = os.path.relpath(file_path, folder_path)
+    return {
+        "File Name": os.path.basename(file_path),
+        "Relative Path": relative_path,
+        "Summary": summary
+    }
+
+def refresh_summaries(watcher, summaries):
+    # Re-summarize only the documents the watcher saw change, and drop
+    # rows for documents that have since been removed.
+    changed = set()
+    while True:
+        try:
+            changed.add(watcher.summary_queue.get_nowait())
+        except queue.Empty:
+            break
+
+    folder_path = watcher.folder_path
+    by_path = {os.path.join(folder_path, row["Relative Path"]): row for row in summaries}
+    for file_path in sorted(changed):
+        if not os.path.exists(file_path):
+            continue
+        try:
+            row = summarize_file(file_path, folder_path)
+            if row is not None:
+                by_path[file_path] = row
+        except Exception as e:
+            st.error(f"Error processing {file_path}: {str(e)}")
+    return [row for path, row in by_path.items() if os.path.exists(path)]
+
+@st.fragment(run_every=5)
+def rerun_on_change(watcher, version):
+    # Cheap poll; summaries are only refreshed when a flush changed something.
+    if watcher.version != version:
+        st.rerun()
+
+def show_watched_summaries(watcher):
+    summaries = refresh_summaries(watcher, st.session_state.summaries)
+    st.session_state.summaries = summaries
+
+    df = pd.DataFrame(summaries)
+    st.dataframe(df)
+    csv = df.to_csv(index=False)
+    st.download_button(
+        label="Download summaries as CSV",
+        data=csv,
+        file_name="file_summaries.csv",
+        mime="text/csv",
+    )
+
 def main():
     st.title("Files Summarizer using TBH-Azure OpenAI")
     
     folder_path = st.text_input("Enter the path to the folder:")
-    
-    if folder_path and os.path.isdir(folder_path):
-        supported_files = get_supported_files(folder_path)
+    scan_filter = scan_filter_inputs()
+    watch_mode = st.checkbox("Watch for changes", help="Re-summarize documents as they are added or changed instead of the whole folder.")
+    # The watcher only needs documents, so other files are never stat'ed or tracked.
+    doc_filter = scan_filter.with_extensions(SUMMARY_EXTENSIONS)
+
+    watcher = st.session_state.get("summary_watcher")
+    # Restarting re-summarizes the folder with the new settings.
+    if watcher is not None and (not watch_mode
+                                or watcher.folder_path != os.path.abspath(folder_path)
+                                or watcher.scan_filter.rules != doc_filter.rules):
+        watcher.stop()
+        st.session_state.summary_watcher = watcher = None
+
+    if watcher is not None:
+        st.success(f"👀 Watching '{watcher.folder_path}' for changes.")
+        version = watcher.version
+        show_watched_summaries(watcher)
+        rerun_on_change(watcher, version)
+    elif folder_path and os.path.isdir(folder_path):
+        summaries = []
+        if watch_mode:
+            # Start watching before summarizing so documents added meanwhile are queued too.
+            watcher = FolderWatcher(folder_path, summary_queue=queue.Queue(), scan_filter=doc_filter)
+            with st.spinner("Scanning folder..."):
+                watcher.start()
+            st.session_state.summary_watcher = watcher
+            st.session_state.summaries = summaries
+            # Reuse the watcher's scan rather than walking the folder again.
+            supported_files = watcher.file_paths()
+        else:
+            supported_files = get_supported_files(folder_path, scan_filter)
         
         if supported_files:
             st.write(f"Found {len(supported_files)} supported files in the folder and its subfolders.")
             
-            summaries = []
-            
             progress_bar = st.progress(0)
             for i, file_path in enumerate(supported_files):
                 try:
-                    if file_path.lower().endswith('.pdf'):
-                        text = get_pdf_text(file_path)
-                    elif file_path.lower().endswith('.docx'):
-                        text = get_docx_text(file_path)
-                    elif file_path.lower().endswith(('.xlsx', '.xls')):
-                        text = get_excel_text(file_path)
-                    else:
-                        continue
-
-                    summary = summarize_text(text)
-                    relative_path = os.path.relpath(file_path, folder_path)
-                    summaries.append({
-                        "File Name": os.path.basename(file_path),
-                        "Relative Path": relative_path,
-                        "Summary": summary
-                    })
+                    row = summarize_file(file_path, folder_path)
+                    if row is not None:
+                        summaries.append(row)
                 except Exception as e:
                     st.error(f"Error processing {file_path}: {str(e)}")
                 progress_bar.progress((i + 1) / len(supported_files))
-            
+        elif watch_mode:
+            st.info("No supported files yet. New documents will be summarized as they appear.")
+        else:
+            st.warning("No supported files found in the specified folder or its subfolders.")
+
+        if watch_mode:
+            st.success(f"👀 Watching '{watcher.folder_path}' for changes.")
+            version = watcher.version
+            show_watched_summaries(watcher)
+            rerun_on_change(watcher, version)
+        elif supported_files:
             # Create a DataFrame and display it
             df = pd.DataFrame(summaries)
             st.dataframe(df)
@@ -123,8 +211,6 @@ def main():
                 file_name="file_summaries.csv",
                 mime="text/csv",
             )
-        else:
-            st.warning("No supported files found in the specified folder or its subfolders.")
     elif folder_path:
         st.error("Invalid folder path. Please enter a valid path.")
 
@@ -0,0 +1,263 @@
+import os
+import re
+import time
+
+DEFAULT_EXCLUDES = [
+    ".git/",
+    ".svn/",
+    "node_modules/",
+    "__pycache__/",
+    ".venv/",
+    "venv/",
+    "backup/",
+    "backups/",
+    "tmp/",
+    "temp/",
+    "*.tmp",
+    "~$*",
+]
+
+_CASE_FLAGS = re.IGNORECASE if os.name == "nt" else 0
+
+
+def _glob_to_regex(glob):
+    regex = ""
+    i = 0
+    while i < len(glob):
+        c = glob[i]
+        if glob.startswith("**/", i):
+            regex += "(?:.*/)?"
+            i += 3
+            continue
+        if glob.startswith("/**", i) and i + 3 == len(glob):
+            regex += "(?:/.*)?"
+            i += 3
+            continue
+        if glob.startswith("**", i):
+            regex += ".*"
+            i += 2
+            continue
+        if c == "*":
+            regex += "[^/]*"
+        elif c == "?":
+            regex += "[^/]"
+        elif c == "[" and "]" in glob[i + 1:]:
+            end = glob.index("]", i + 1)
+            body = glob[i + 1:end]
+            if body.startswith("!"):
+                body = "^" + body[1:]
+            regex += "[" + body.replace("\\", "\\\\") + "]"
+            i = end
+        else:
+            regex += re.escape(c)
+        i += 1
+    return regex
+
+
+def _pattern_regex(pattern):
+    """Translate one gitignore-style pattern into (regex without '$', dir_only).
+
+    A trailing '/' limits a pattern to directories, a leading or inner '/'
+    anchors it to the scan root, and otherwise it matches at any depth.
+    """
+    dir_only = pattern.endswith("/")
+    stripped = pattern.rstrip("/")
+    anchored = "/" in stripped
+    regex = ("^" if anchored else "(?:^|.*/)") + _glob_to_regex(stripped.lstrip("/"))
+    try:
+        re.compile(regex)
+    except re.error as e:
+        raise ValueError(f"Invalid pattern '{pattern}': {e}") from e
+    return regex, dir_only
+
+
+def _combine(parts):
+    if not parts:
+        return None
+    return re.compile("|".join(f"(?:{p})" for p in parts), _CASE_FLAGS)
+
+
+def _compile_patterns(patterns):
+    """Split gitignore-style patterns into combined (dir, file) regexes."""
+    dir_parts, file_parts = [], []
+    for pattern in patterns:
+        regex, dir_only = _pattern_regex(pattern)
+        dir_parts.append(regex + "$")
+        if not dir_only:
+            file_parts.append(regex + "$")
+    return _combine(dir_parts), _combine(file_parts)
+
+
+def _compile_includes(patterns):
+    """Combine include patterns into one file regex.
+
+    A pattern that names a folder includes everything inside it, so
+    'reports' and 'reports/' both keep reports/2024/q1.pdf.
+    """
+    parts = []
+    for pattern in patterns:
+        regex, dir_only = _pattern_regex(pattern)
+        parts.append(regex + ("/.*$" if dir_only else "(?:/.*)?$"))
+    return _combine(parts)
+
+
+def parse_patterns(text):
+    patterns = []
+    for line in re.split(r"[\n,]", text or ""):
+        line = line.strip()
+        if line and not line.startswith("#"):
+            patterns.append(line)
+    return patterns
+
+
+class ScanFilter:
+    """Include/exclude rules compiled once and applied while walking.
+
+    Excluded directories are pruned before os.walk descends into them, so
+    a skipped subtree is never listed or stat'ed. Patterns prefixed with
+    '!' re-include paths an exclude pattern would otherwise drop. Size
+    and age limits only apply to files and cost one stat per kept file.
+    `extensions` keeps only files ending in one of them, before any stat.
+    Raises ValueError naming the pattern if one cannot be compiled.
+    """
+
+    def __init__(self, include=None, exclude=None, max_depth=None,
+                 min_size=None, max_size=None, min_age_days=None, max_age_days=None,
+                 extensions=None):
+        include = list(include or [])
+        exclude = list(exclude or [])
+        # The raw settings, so callers can tell whether the rules changed.
+        self.rules = (tuple(include), tuple(exclude), max_depth,
+                      min_size, max_size, min_age_days, max_age_days, extensions)
+        self.exclude_dir, self.exclude_file = _compile_patterns(
+            [p for p in exclude if not p.startswith("!")])
+        self.keep_dir, self.keep_file = _compile_patterns(
+            [p[1:] for p in exclude if p.startswith("!")])
+        self.include_file = _compile_includes(include)
+        self.max_depth = max_depth
+        self.min_size = min_size
+        self.max_size = max_size
+        self.min_age_days = min_age_days
+        self.max_age_days = max_age_days
+        self.extensions = tuple(e.lower() for e in extensions) if extensions else None
+
+    def with_extensions(self, extensions):
+        """A copy of these rules that also limits files to the given extensions."""
+        return ScanFilter(*self.rules[:-1], extensions=extensions)
+
+    @property
+    def needs_stat(self):
+        return any(limit is not None for limit in
+                   (self.min_size, self.max_size, self.min_age_days, self.max_age_days))
+
+    def allows_dir(self, rel_path):
+        rel_path = rel_path.replace(os.sep, "/")
+        if self.exclude_dir is None or not self.exclude_dir.match(rel_path):
+            return True
+        return self.keep_dir is not None and bool(self.keep_dir.match(rel_path))
+
+    def allows_file(self, rel_path, file_path=None):
+        rel_path = rel_path.replace(os.sep, "/")
+        if self.extensions is not None and not rel_path.lower().endswith(self.extensions):
+            return False
+        if self.include_file is not None and not self.include_file.match(rel_path):
+            return False
+        if self.exclude_file is not None and self.exclude_file.match(rel_path):
+            if self.keep_file is None or not self.keep_file.match(rel_path):
+                return False
+        if not self.needs_stat or file_path is None:
+            return True
+
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            return True  # Let the caller report it like any unreadable file.
+        if self.min_size is not None and stat.st_size < self.min_size:
+            return False
+        if self.max_size is not None and stat.st_size > self.max_size:
+            return False
+        age_days = (time.time() - stat.st_mtime) / 86400
+        if self.min_age_days is not None and age_days < self.min_age_days:
+            return False
+        if self.max_age_days is not None and age_days > self.max_age_days:
+            return False
+        return True
+
+    def allows_parents(self, folder_path, path):
+        """Check the depth and ancestor folders of a path, without touching the path itself."""
+        parts = os.path.relpath(path, folder_path).split(os.sep)
+        if self.max_depth is not None and len(parts) - 1 > self.max_depth:
+            return False
+        for i in range(1, len(parts)):
+            if not self.allows_dir(os.sep.join(parts[:i])):
+                return False
+        return True
+
+    def allows_path(self, folder_path, path, is_dir):
+        """Check a single path, including its ancestors and depth, against the rules."""
+        if not self.allows_parents(folder_path, path):
+            return False
+        rel_path = os.path.relpath(path, folder_path)
+        if is_dir:
+            return self.allows_dir(rel_path)
+        return self.allows_file(rel_path, path)
+
+    def walk(self, folder_path, start=None):
+        """os.walk with excluded directories pruned before descending.
+
+        Yields (root, dirs, files) like os.walk. Directories at max_depth
+        are still listed in dirs but are not descended into. `start` walks
+        a subfolder while keeping patterns and depth relative to folder_path.
+        """
+        for root, dirs, files in os.walk(start or folder_path):
+            rel_root = os.path.relpath(root, folder_path)
+            if rel_root == ".":
+                rel_root, depth = "", 0
+            else:
+                depth = rel_root.count(os.sep) + 1
+            if self.max_depth is not None and depth > self.max_depth:
+                # Only reachable when `start` is already past max_depth.
+                dirs[:] = []
+                continue
+
+            dirs[:] = [d for d in dirs if self.allows_dir(os.path.join(rel_root, d))]
+            files = [f for f in files
+                     if self.allows_file(os.path.join(rel_root, f), os.path.join(root, f))]
+            listed_dirs = list(dirs)
+            if self.max_depth is not None and depth >= self.max_depth:
+                dirs[:] = []
+            yield root, listed_dirs, files
+
+
+def scan_filter_inputs(default_excludes=DEFAULT_EXCLUDES):
+    """Streamlit controls for the scan rules, shared by the app pages."""
+    import streamlit as st
+
+    with st.expander("🔎 Include / exclude rules"):
+        col1, col2 = st.columns(2)
+        include_text = col1.text_area(
+            "Include patterns (one per line)",
+            help="Gitignore-style patterns such as *.pdf or reports/**. Leave empty to include every file.")
+        exclude_text = col2.text_area(
+            "Exclude patterns (one per line)", value="\n".join(default_excludes),
+            help="Gitignore-style patterns. A trailing / matches folders only; prefix with ! to re-include.")
+        col1, col2, col3, col4, col5 = st.columns(5)
+        max_depth = col1.number_input("Max depth", min_value=0, value=None, step=1)
+        min_size = col2.number_input("Min size (KB)", min_value=0.0, value=None)
+        max_size = col3.number_input("Max size (KB)", min_value=0.0, value=None)
+        min_age = col4.number_input("Min age (days)", min_value=0.0, value=None)
+        max_age = col5.number_input("Max age (days)", min_value=0.0, value=None)
+
+    try:
+        return ScanFilter(
+            include=parse_patterns(include_text),
+            exclude=parse_patterns(exclude_text),
+            max_depth=int(max_depth) if max_depth is not None else None,
+            min_size=min_size * 1024 if min_size is not None else None,
+            max_size=max_size * 1024 if max_size is not None else None,
+            min_age_days=min_age,
+            max_age_days=max_age,
+        )
+    except ValueError as e:
+        st.error(str(e))
+        st.stop()
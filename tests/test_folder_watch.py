@@ -0,0 +1,170 @@
+import os
+import queue
+import shutil
+import threading
+import time
+from folder_watch import FolderWatcher
+from scan_filters import DEFAULT_EXCLUDES, ScanFilter
+
+
+def make_watcher(root, **kwargs):
+    watcher = FolderWatcher(str(root), scan_filter=ScanFilter(exclude=DEFAULT_EXCLUDES), **kwargs)
+    watcher.scan()
+    return watcher
+
+
+def touch(path, size=10):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text("x" * size)
+
+
+def test_scan_counts_and_skips_excluded(tmp_path):
+    touch(tmp_path / "a.txt")
+    touch(tmp_path / "docs" / "b.pdf", size=20)
+    touch(tmp_path / "node_modules" / "p" / "i.js")
+    watcher = make_watcher(tmp_path)
+    results = watcher.snapshot()
+    assert (results["file_count"], results["dir_count"], results["total_size"]) == (2, 1, 30)
+    assert results["file_types"] == {".txt": 1, ".pdf": 1}
+
+
+def test_create_modify_delete(tmp_path):
+    touch(tmp_path / "a.txt")
+    watcher = make_watcher(tmp_path)
+
+    touch(tmp_path / "b.txt", size=5)
+    touch(tmp_path / "a.txt", size=100)
+    watcher.mark_changed(str(tmp_path / "b.txt"))
+    watcher.mark_changed(str(tmp_path / "a.txt"))
+    watcher.flush()
+    assert (watcher.file_count, watcher.total_size) == (2, 105)
+
+    os.remove(tmp_path / "a.txt")
+    watcher.mark_changed(str(tmp_path / "a.txt"))
+    watcher.flush()
+    assert (watcher.file_count, watcher.total_size) == (1, 5)
+    assert watcher.file_types == {".txt": 1}
+
+
+def test_new_folder_is_walked_and_queued_for_summary(tmp_path):
+    summary_queue = queue.Queue()
+    watcher = make_watcher(tmp_path, summary_queue=summary_queue)
+
+    touch(tmp_path / "new" / "deep" / "r.pdf")
+    touch(tmp_path / "new" / "notes.txt")
+    for path in ("new", "new/deep", "new/deep/r.pdf", "new/notes.txt"):
+        watcher.mark_changed(str(tmp_path / path))
+    watcher.flush()
+
+    assert (watcher.file_count, watcher.dir_count) == (2, 2)
+    assert summary_queue.get_nowait() == str(tmp_path / "new" / "deep" / "r.pdf")
+    assert summary_queue.empty()
+
+
+def test_move_folder_keeps_totals(tmp_path):
+    touch(tmp_path / "src" / "a" / "x.pdf")
+    touch(tmp_path / "dest" / "keep.txt")
+    watcher = make_watcher(tmp_path)
+
+    shutil.move(str(tmp_path / "src" / "a"), str(tmp_path / "dest" / "a"))
+    watcher.mark_changed(str(tmp_path / "src" / "a"))
+    watcher.mark_changed(str(tmp_path / "dest" / "a"))
+    watcher.flush()
+
+    assert (watcher.file_count, watcher.dir_count) == (2, 3)
+    assert str(tmp_path / "dest" / "a" / "x.pdf") in watcher.items
+    assert not any(path.startswith(str(tmp_path / "src" / "a")) for path in watcher.items)
+
+
+def test_deleted_folder_removes_subtree(tmp_path):
+    touch(tmp_path / "d" / "e" / "f.txt")
+    touch(tmp_path / "g.txt")
+    watcher = make_watcher(tmp_path)
+
+    shutil.rmtree(tmp_path / "d")
+    watcher.mark_changed(str(tmp_path / "d"))
+    watcher.flush()
+
+    assert list(watcher.items) == [str(tmp_path / "g.txt")]
+    assert (watcher.file_count, watcher.dir_count, watcher.total_size) == (1, 0, 10)
+
+
+def test_events_under_excluded_folders_are_not_queued(tmp_path):
+    watcher = make_watcher(tmp_path)
+    touch(tmp_path / ".git" / "index")
+    watcher.mark_changed(str(tmp_path / ".git"))
+    watcher.mark_changed(str(tmp_path / ".git" / "index"))
+    watcher.mark_changed(str(tmp_path / "node_modules" / "p" / "i.js"))
+    assert watcher.flush() == 0
+    assert watcher.items == {}
+
+
+def test_continuous_writes_still_flush_within_max_latency(tmp_path):
+    watcher = make_watcher(tmp_path, debounce=0.2, max_latency=0.4)
+    worker = threading.Thread(target=watcher._run, daemon=True)
+    worker.start()
+    try:
+        log_path = tmp_path / "app.log"
+        deadline = time.monotonic() + 1.5
+        while time.monotonic() < deadline and watcher.file_count == 0:
+            touch(log_path)
+            watcher.mark_changed(str(log_path))
+            time.sleep(0.05)
+        assert watcher.file_count == 1
+    finally:
+        watcher.stop()
+
+
+def test_changes_seen_during_scan_are_applied_after_it(tmp_path):
+    watcher = FolderWatcher(str(tmp_path))
+    touch(tmp_path / "early.txt")
+    watcher.mark_changed(str(tmp_path / "early.txt"))
+    os.remove(tmp_path / "early.txt")
+    touch(tmp_path / "late.txt")
+    watcher.scan()
+    watcher.flush()
+    assert list(watcher.items) == [str(tmp_path / "late.txt")]
+
+
+def test_start_records_files_created_while_watching(tmp_path):
+    watcher = FolderWatcher(str(tmp_path), debounce=0.05)
+    watcher.start()
+    try:
+        touch(tmp_path / "new.txt")
+        deadline = time.monotonic() + 5
+        while time.monotonic() < deadline and watcher.file_count == 0:
+            time.sleep(0.05)
+        assert watcher.file_count == 1
+    finally:
+        watcher.stop()
+
+
+def test_incremental_matches_rescan_under_max_depth(tmp_path):
+    touch(tmp_path / "a.txt")
+    (tmp_path / "one").mkdir()
+    watcher = FolderWatcher(str(tmp_path), scan_filter=ScanFilter(max_depth=1))
+    watcher.scan()
+
+    touch(tmp_path / "one" / "two" / "deep.txt")
+    (tmp_path / "one" / "two" / "three").mkdir()
+    for path in ("one/two", "one/two/deep.txt", "one/two/three"):
+        watcher.mark_changed(str(tmp_path / path))
+    watcher.flush()
+
+    rescanned = FolderWatcher(str(tmp_path), scan_filter=ScanFilter(max_depth=1))
+    rescanned.scan()
+    assert sorted(watcher.items) == sorted(rescanned.items)
+    assert (watcher.file_count, watcher.dir_count) == (rescanned.file_count, rescanned.dir_count)
+
+
+def test_version_only_changes_when_events_are_applied(tmp_path):
+    watcher = make_watcher(tmp_path)
+    version = watcher.version
+    watcher.flush()
+    assert watcher.version == version
+
+    touch(tmp_path / "a.txt")
+    watcher.mark_changed(str(tmp_path / "a.txt"))
+    watcher.flush()
+    assert watcher.snapshot()["version"] == version + 1
+    assert watcher.tree_structure()[-1].endswith("📄 a.txt (0.01 KB)")
@@ -0,0 +1,99 @@
+import os
+import re
+import pytest
+from scan_filters import DEFAULT_EXCLUDES, ScanFilter, parse_patterns
+
+
+def make_tree(root, paths):
+    for path in paths:
+        full_path = root / path
+        full_path.parent.mkdir(parents=True, exist_ok=True)
+        full_path.write_text("x" * 10)
+
+
+def walked_files(scan_filter, root):
+    return sorted(
+        os.path.relpath(os.path.join(dir_path, name), root).replace(os.sep, "/")
+        for dir_path, dirs, files in scan_filter.walk(str(root))
+        for name in files
+    )
+
+
+def test_default_excludes_prune_directories(tmp_path, monkeypatch):
+    make_tree(tmp_path, ["a.txt", ".git/objects/x", "node_modules/p/i.js", "src/b.py", "src/c.tmp"])
+    listed = []
+    real_walk = os.walk
+
+    def recording_walk(top):
+        for root, dirs, files in real_walk(top):
+            listed.append(os.path.relpath(root, tmp_path))
+            yield root, dirs, files
+
+    monkeypatch.setattr(os, "walk", recording_walk)
+    assert walked_files(ScanFilter(exclude=DEFAULT_EXCLUDES), tmp_path) == ["a.txt", "src/b.py"]
+    assert sorted(listed) == [".", "src"]
+
+
+def test_negated_exclude_reincludes(tmp_path):
+    make_tree(tmp_path, ["keep.tmp", "drop.tmp"])
+    scan_filter = ScanFilter(exclude=["*.tmp", "!keep.tmp"])
+    assert walked_files(scan_filter, tmp_path) == ["keep.tmp"]
+
+
+@pytest.mark.parametrize("pattern", ["reports/", "reports", "/reports", "reports/**"])
+def test_folder_include_covers_contents(tmp_path, pattern):
+    make_tree(tmp_path, ["reports/2024/q1.pdf", "other/x.pdf", "top.pdf"])
+    assert walked_files(ScanFilter(include=[pattern]), tmp_path) == ["reports/2024/q1.pdf"]
+
+
+def test_anchored_and_glob_includes(tmp_path):
+    make_tree(tmp_path, ["a.pdf", "sub/b.pdf", "sub/c.txt"])
+    assert walked_files(ScanFilter(include=["*.pdf"]), tmp_path) == ["a.pdf", "sub/b.pdf"]
+    assert walked_files(ScanFilter(include=["/*.pdf"]), tmp_path) == ["a.pdf"]
+
+
+def test_max_depth_lists_but_does_not_descend(tmp_path):
+    make_tree(tmp_path, ["a.txt", "one/b.txt", "one/two/c.txt"])
+    walked = list(ScanFilter(max_depth=1).walk(str(tmp_path)))
+    assert [os.path.relpath(root, tmp_path) for root, _, _ in walked] == [".", "one"]
+    assert walked[1][1] == ["two"]
+
+
+def test_size_limits(tmp_path):
+    make_tree(tmp_path, ["small.txt"])
+    (tmp_path / "big.txt").write_text("x" * 2000)
+    assert walked_files(ScanFilter(min_size=1000), tmp_path) == ["big.txt"]
+    assert walked_files(ScanFilter(max_size=1000), tmp_path) == ["small.txt"]
+
+
+def test_allows_parents_rejects_paths_under_excluded_folders(tmp_path):
+    scan_filter = ScanFilter(exclude=DEFAULT_EXCLUDES, max_depth=2)
+    root = str(tmp_path)
+    assert not scan_filter.allows_parents(root, os.path.join(root, "node_modules", "p", "i.js"))
+    assert not scan_filter.allows_parents(root, os.path.join(root, "a", "b", "c", "d.txt"))
+    assert scan_filter.allows_parents(root, os.path.join(root, "a", "b", "c.txt"))
+
+
+@pytest.mark.parametrize("pattern", ["[]]", "[z-a]"])
+def test_invalid_pattern_names_the_pattern(pattern):
+    with pytest.raises(ValueError, match=re.escape(pattern)):
+        ScanFilter(exclude=[pattern])
+    with pytest.raises(ValueError, match=re.escape(pattern)):
+        ScanFilter(include=[pattern])
+
+
+def test_parse_patterns():
+    assert parse_patterns("*.pdf, reports/\n# note\n\n.git/") == ["*.pdf", "reports/", ".git/"]
+
+
+def test_with_extensions_keeps_rules_and_limits_files(tmp_path):
+    make_tree(tmp_path, ["a.pdf", "b.txt", "node_modules/c.pdf", "sub/D.PDF"])
+    scan_filter = ScanFilter(exclude=DEFAULT_EXCLUDES).with_extensions((".pdf",))
+    assert walked_files(scan_filter, tmp_path) == ["a.pdf", "sub/D.PDF"]
+    assert scan_filter.rules[:-1] == ScanFilter(exclude=DEFAULT_EXCLUDES).rules[:-1]
+
+
+def test_walk_from_start_past_max_depth_yields_nothing(tmp_path):
+    make_tree(tmp_path, ["one/two/deep.txt", "one/two/three/x.txt"])
+    walked = list(ScanFilter(max_depth=1).walk(str(tmp_path), start=str(tmp_path / "one" / "two")))
+    assert walked == []